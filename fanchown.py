@@ -4,10 +4,9 @@ import sys
 import argparse
 import os.path
 from pwd import getpwnam
-from lib import Settings, PACKAGE, PACKAGE_NAME, PACKAGE_VERSION, utils
+from lib import Settings, PACKAGE_NAME, utils
 from lib.logger import Logger, ConsoleLogger, ConfirmPromptBuilder
 from lib.exceptions import ConfigurationError, ControlException
-from lib.pid_file import PIDFile
 from lib import utils
 from lib.control import BaseControl
 from lib.hwmon import HwmonProvider
@@ -21,6 +21,21 @@ class ANSIFormatter:
     COLOUR_CYAN = 6
     COLOUR_WHITE = 7
 
+    STYLE_VERBOSE = 'verbose'
+    STYLE_DEBUG = 'debug'
+    STYLE_INFO = 'info'
+    STYLE_WARNING = 'warning'
+    STYLE_ERROR = 'error'
+    STYLE_OPTION = 'option'
+    STYLE_OPTION_HIGHLIGHT = 'option_highlight'
+    STYLE_VALUE = 'value'
+
+    code_cache = {}
+    'Escape sequences already built by ansi_code, shared by all instances'
+
+    style_cache = {}
+    'Style codes and prefixes per colour mode, shared by all instances'
+
 
     def __init__(self, features=BASIC):
         self.set_features(features)
@@ -30,12 +45,58 @@ class ANSIFormatter:
         self.is_monochrome = (features == self.MONOCHROME)
         self.use_16 = (features == self.BASIC) and not self.is_monochrome
         self.use_256 = (features == self.EXPANDED) and not self.is_monochrome
+        if self.use_256 not in self.style_cache:
+            style_codes = self.get_style_codes()
+            style_prefixes = {style: self.ansi_code(codes) for style, codes in style_codes.items()}
+            self.style_cache[self.use_256] = (style_codes, style_prefixes)
+        self.style_codes, self.style_prefixes = self.style_cache[self.use_256]
+        self.reset_code = self.ansi_code(self.ANSI_RESET)
+
+
+    def get_style_codes(self):
+        '''
+        Resolve the ANSI-codes used for each style. This is done once when
+        features are set, so that the in_<style> methods don't need to check
+        which colours we're using every time they're called.
+        '''
+        if self.use_256:
+            return {
+                self.STYLE_VERBOSE: self.fg_colour_256(242),
+                self.STYLE_DEBUG: self.fg_colour_256(248),
+                self.STYLE_INFO: self.fg_colour_256(255),
+                self.STYLE_WARNING: self.fg_colour_256(220),
+                self.STYLE_ERROR: self.fg_colour_256(160),
+                self.STYLE_OPTION: self.fg_colour_256(63),
+                self.STYLE_OPTION_HIGHLIGHT: self.fg_colour_256(75),
+                self.STYLE_VALUE: self.fg_colour_256(75),
+            }
+        return {
+            self.STYLE_VERBOSE: '2;' + self.fg_colour(self.COLOUR_BLACK),
+            self.STYLE_DEBUG: '2;' + self.fg_colour(self.COLOUR_BLACK),
+            self.STYLE_INFO: self.fg_colour(self.COLOUR_WHITE),
+            self.STYLE_WARNING: self.fg_colour(self.COLOUR_YELLOW),
+            self.STYLE_ERROR: self.fg_colour(self.COLOUR_RED),
+            self.STYLE_OPTION: '2;' + self.fg_colour(self.COLOUR_BLUE),
+            self.STYLE_OPTION_HIGHLIGHT: self.fg_colour(self.COLOUR_BLUE),
+            self.STYLE_VALUE: self.fg_colour(self.COLOUR_BLUE),
+        }
 
 
     def ansi_code(self, code):
-        if type(code) is list:
-            code = ';'.join([str(v) for v in code])
-        return '\x1b[' + str(code) +'m'
+        '''
+        Get the escape sequence for the specified ANSI-code, multiple codes
+        should be passed as a single string separated by ';'. There's only a
+        handful of these in use, so they're built once and then looked up
+        from code_cache.
+        '''
+        sequence = self.code_cache.get(code)
+        if sequence is None:
+            sequence = self.code_cache.setdefault(code, self.build_ansi_code(code))
+        return sequence
+
+
+    def build_ansi_code(self, code):
+        return f'\x1b[{code}m'
 
 
     def ansi_wrap(self, codes, text):
@@ -45,7 +106,7 @@ class ANSIFormatter:
         formatting for any subsequent output. This is used with the in_<style>
         formatting methods.
         '''
-        return self.ansi_code(codes) + text + self.ansi_code(self.ANSI_RESET)
+        return self.ansi_code(codes) + text + self.reset_code
 
 
     def ansi_start(self, codes, text):
@@ -59,31 +120,36 @@ class ANSIFormatter:
 
 
     def ansi_end(self):
-        return self.ansi_code(self.ANSI_RESET)
+        return self.reset_code
 
 
-    def colour(self, base, offset):
+    @staticmethod
+    def colour(base, offset):
         return base + offset
     
 
-    def fg_colour(self, offset, bright=False):
+    @classmethod
+    def fg_colour(cls, offset, bright=False):
         if bright:
-            return self.colour(self.FG_BASE, offset)
-        return self.colour(self.FG_BRIGHT, offset)
+            return str(cls.colour(cls.FG_BASE, offset))
+        return str(cls.colour(cls.FG_BRIGHT, offset))
 
 
-    def bg_colour(self, offset, bright=False):
+    @classmethod
+    def bg_colour(cls, offset, bright=False):
         if bright:
-            return self.colour(self.BG_BASE, offset)
-        return self.colour(self.BG_BRIGHT, offset)
+            return str(cls.colour(cls.BG_BASE, offset))
+        return str(cls.colour(cls.BG_BRIGHT, offset))
 
 
-    def fg_colour_256(self, colour_number):
-        return [38, 5, colour_number]
+    @staticmethod
+    def fg_colour_256(colour_number):
+        return '38;5;{}'.format(colour_number)
 
 
-    def bg_colour_256(self, colour_number):
-        return [48, 5, colour_number]
+    @staticmethod
+    def bg_colour_256(colour_number):
+        return '48;5;{}'.format(colour_number)
 
 
     def get_wrap_func(self, wrap_func):
@@ -106,44 +172,41 @@ class ANSIFormatter:
 
 
     def in_verbose(self, str, wrap_func=None):
-        wrap_func = self.get_wrap_func(wrap_func)
-        if self.use_256:
-            return wrap_func(self.fg_colour_256(242), str)
-        return wrap_func([2, self.fg_colour(self.COLOUR_BLACK)], str)
+        if wrap_func is None:
+            return self.style_prefixes[self.STYLE_VERBOSE] + str + self.reset_code
+        return wrap_func(self.style_codes[self.STYLE_VERBOSE], str)
 
 
     def in_debug(self, str, wrap_func=None):
-        wrap_func = self.get_wrap_func(wrap_func)
-        if self.use_256:
-            return wrap_func(self.fg_colour_256(248), str)
-        return wrap_func([2, self.fg_colour(self.COLOUR_BLACK)], str)
+        if wrap_func is None:
+            return self.style_prefixes[self.STYLE_DEBUG] + str + self.reset_code
+        return wrap_func(self.style_codes[self.STYLE_DEBUG], str)
 
 
     def in_info(self, str, wrap_func=None):
-        wrap_func = self.get_wrap_func(wrap_func)
-        if self.use_256:
-            return wrap_func(self.fg_colour_256(255), str)
-        return wrap_func(self.fg_colour(self.COLOUR_WHITE), str)
+        if wrap_func is None:
+            return self.style_prefixes[self.STYLE_INFO] + str + self.reset_code
+        return wrap_func(self.style_codes[self.STYLE_INFO], str)
 
 
     def in_warning(self, str, wrap_func=None):
-        wrap_func = self.get_wrap_func(wrap_func)
-        if self.use_256:
-            return wrap_func(self.fg_colour_256(220), str)
-        return wrap_func(self.fg_colour(self.COLOUR_YELLOW), str)
+        if wrap_func is None:
+            return self.style_prefixes[self.STYLE_WARNING] + str + self.reset_code
+        return wrap_func(self.style_codes[self.STYLE_WARNING], str)
 
 
     def in_error(self, str, wrap_func=None):
-        wrap_func = self.get_wrap_func(wrap_func)
-        if self.use_256:
-            return wrap_func(self.fg_colour_256(160), str)
-        return wrap_func(self.fg_colour(self.COLOUR_RED), str)
+        if wrap_func is None:
+            return self.style_prefixes[self.STYLE_ERROR] + str + self.reset_code
+        return wrap_func(self.style_codes[self.STYLE_ERROR], str)
 
 
     # Formatting options used with InteractiveLogger
     def in_prompt(self, str, wrap_func=None):
         'Used to display input prompts'
-        return self.in_info(str, wrap_func=wrap_func)
+        if wrap_func is None:
+            return self.style_prefixes[self.STYLE_INFO] + str + self.reset_code
+        return wrap_func(self.style_codes[self.STYLE_INFO], str)
 
 
     def in_highlight(self, str, wrap_func=None):
@@ -151,28 +214,27 @@ class ANSIFormatter:
         
         WHile this is certainly an option we should try to use it sparingly to
         avoid looking like a pain sample card'''
-        return self.in_info(str, wrap_func=wrap_func)
+        if wrap_func is None:
+            return self.style_prefixes[self.STYLE_INFO] + str + self.reset_code
+        return wrap_func(self.style_codes[self.STYLE_INFO], str)
 
 
     def in_option(self, str, wrap_func=None):
         'Used to format regular prompt choices'
-        wrap_func = self.get_wrap_func(wrap_func)
-        if self.use_256:
-            return wrap_func(self.fg_colour_256(63), str)
-        return wrap_func([2, self.fg_colour(self.COLOUR_BLUE)], str)
+        if wrap_func is None:
+            return self.style_prefixes[self.STYLE_OPTION] + str + self.reset_code
+        return wrap_func(self.style_codes[self.STYLE_OPTION], str)
 
 
     def in_option_highlight(self, str, wrap_func=None):
         'Used to format highlighted prompt choices'
-        wrap_func = self.get_wrap_func(wrap_func)
-        if self.use_256:
-            return wrap_func(self.fg_colour_256(75), str)
-        return wrap_func([self.fg_colour(self.COLOUR_BLUE)], str)
-    
+        if wrap_func is None:
+            return self.style_prefixes[self.STYLE_OPTION_HIGHLIGHT] + str + self.reset_code
+        return wrap_func(self.style_codes[self.STYLE_OPTION_HIGHLIGHT], str)
+
 
     def in_value(self, str, wrap_func=None):
         'Used to format input values from the user'
-        wrap_func = self.get_wrap_func(wrap_func)
-        if self.use_256:
-            return wrap_func(self.fg_colour_256(75), str)
-        return wrap_func([self.fg_colour(self.COLOUR_BLUE)], str)
\ No newline at end of file
+        if wrap_func is None:
+            return self.style_prefixes[self.STYLE_VALUE] + str + self.reset_code
+        return wrap_func(self.style_codes[self.STYLE_VALUE], str)
\ No newline at end of file
@@ -7,6 +7,12 @@ from .section import SectionContext
 from .main_complete import MainCompleteContext
 from .fan_control import ControlFanContext
 
+__all__ = [
+    'InteractiveContext', 'MainContext', 'LoggingContext', 'HWMONContext',
+    'MainLoadedContext', 'SectionContext', 'MainCompleteContext',
+    'ControlFanContext',
+]
+
 # Context structure:
 #
 # - main
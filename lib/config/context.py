@@ -1,30 +1,58 @@
-import traceback
-from ..logger import Logger, InteractiveLogger, ConfirmPromptBuilder, PromptValidationException
+import traceback, functools
+from collections import namedtuple
+from ..logger import Logger, InteractiveLogger, ConfirmPromptBuilder, PromptValidationException, BufferedContext
 from ..control import Fan
 from ..hwmon import HwmonObject, HwmonProvider
 from ..logger import PromptBuilder
 from .. import utils
 
 
+SummaryFormat = namedtuple('SummaryFormat', ['styling', 'key', 'line_padding'], defaults=[Logger.DEBUG, None, ''])
+'''
+Optional third value of a summary item, sets the styling used for the line,
+an option key to print after the value and any padding added at the end.
+'''
+
+
 class Context:
     '''
     Base class, mostly here to define operations that don't require any kind of
     data as well as provide static building blocks for InteractiveContext.
     '''
     ACRONYMS = utils.ACRONYMS
+    SUFFIX = 'Context'
+    context_name = ''
+
+
+    def __init_subclass__(cls, **kwargs):
+        '''
+        Works out the name used when printing a context once per class, this
+        is the class name without the Context-suffix.
+        '''
+        super().__init_subclass__(**kwargs)
+        name = cls.__name__
+        if name.endswith(cls.SUFFIX):
+            name = name[:-len(cls.SUFFIX)]
+        cls.context_name = name
 
 
     def __str__(self):
-        suffix = 'Context'
-        name = self.__class__.__name__
-        if name.endswith(suffix):
-            name = name[:-len(suffix)]
-        return name
+        return self.context_name
 
 
     @staticmethod
     def to_sentence(*args):
-        return utils.to_sentence(*args, acronyms=__class__.ACRONYMS)
+        return __class__.build_sentence(args, frozenset(__class__.ACRONYMS))
+
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def build_sentence(words, acronyms):
+        '''
+        Cached version of utils.to_sentence, the same handful of sentences are
+        built over and over again when setting up contexts and prompts.
+        '''
+        return utils.to_sentence(*words, acronyms=acronyms)
 
 
 class InteractiveContext(Context):
@@ -68,12 +96,29 @@ class InteractiveContext(Context):
     SENSOR_MAX = Context.to_sentence(SENSOR, MAX)
     PWM_INPUT = 'PWM Input'
     STATUS = 'Status'
+    PATH_CHECKED = 'Path checked'
+    DRIVER_CHECKED = 'Driver checked'
+
+    INVALID_NUMBER = 'not a number'
+    INVALID_TEMP_MIN = 'less than {}'.format(Fan.SENSOR_MIN)
+    INVALID_PWM_MIN = 'less than {}'.format(Fan.PWM_MIN)
+    INVALID_PWM_MAX = 'greater than {}'.format(Fan.PWM_MAX)
 
     SUBKEY_INDENT = '  '
     SUBKEY_CHILD =  '\u21B3 '
+    CHILD_MINIMUM = SUBKEY_CHILD + MINIMUM
+    CHILD_MAXIMUM = SUBKEY_CHILD + MAXIMUM
+    CHILD_START = SUBKEY_CHILD + START
+    CHILD_STOP = SUBKEY_CHILD + STOP
+    CHILD_STATUS = SUBKEY_CHILD + STATUS
+    CHILD_PATH_CHECKED = SUBKEY_CHILD + PATH_CHECKED
+    CHILD_DRIVER_CHECKED = SUBKEY_CHILD + DRIVER_CHECKED
+    CHILD_ERROR = SUBKEY_INDENT + SUBKEY_CHILD + 'ERROR'
 
     CONFIRM_EXIT = False 
 
+    DEFAULT_SUMMARY_FORMAT = SummaryFormat()
+
     def __init__(self, fan_config, parent):
         self.fan_config = fan_config
         self.parent = parent
@@ -81,13 +126,6 @@ class InteractiveContext(Context):
         self.console = self.fan_config.console
 
 
-    # def __getattribute__(self, name):
-    #     match name:
-    #         case 'console':
-    #             return self.fan_config.console
-    #     return super().__getattribute__(name)
-
-    
     def interact(self, auto_select=None):
         '''
         Nothing here, but that's only to be expected from a base class. The
@@ -126,9 +164,21 @@ class InteractiveContext(Context):
 
 
     def message(self, message='', styling=InteractiveLogger.DIRECT_REGULAR, end='\n', flow_text=False):
+        # Blank lines are used a lot as separators, so skip formatting those
+        if message == '' and styling == InteractiveLogger.DIRECT_REGULAR:
+            self.console.write(end)
+            return
         self.console.log_direct(message, styling=styling, end=end, flow_text=flow_text)
 
 
+    def buffered_output(self):
+        '''
+        Returns a context manager that holds back messages until leaving it,
+        so that longer listings are written to the console in one go.
+        '''
+        return BufferedContext(self.console)
+
+
     def summary(self, items=None, sep=': ', prefix=SUBKEY_INDENT, title='Summary'):
         '''
         Used near the start of a context interaction to summarise common values
@@ -138,42 +188,48 @@ class InteractiveContext(Context):
         '''
         if not items:
             return
-        self.message('{}:'.format(title), styling=InteractiveLogger.DIRECT_HIGHLIGHT)
-        num_lines = 1
-        key_pad = len(max([key for key, value, *params in items], key=len)) + len(sep)
-        value_pad = len(max([value for key, value, *params in items], key=len)) + len(sep)
-        value_pad = utils.pad_number(value_pad)
-
-        for key, value, *params in items:
-            formatting = self.__get_formatting_from(params)
-            
-            if formatting['key']:
-                self.message(prefix + self.__format_summary_entry(key, value, key_pad=key_pad, value_pad=value_pad, sep=sep), styling=formatting['styling'], end='')
-                self.message(formatting['key'] + formatting['line_padding'], styling=InteractiveLogger.DIRECT_OPTION)
-            else:
-                self.message(prefix + self.__format_summary_entry(key, value, key_pad=key_pad, value_pad=value_pad, sep=sep) + formatting['line_padding'], styling=formatting['styling'])
+        with self.buffered_output():
+            self.message(f'{title}:', styling=InteractiveLogger.DIRECT_HIGHLIGHT)
+            num_lines = 1
+            # Find the longest key and value in a single pass
+            key_max = value_max = 0
+            for key, value, *params in items:
+                if len(key) > key_max:
+                    key_max = len(key)
+                if len(value) > value_max:
+                    value_max = len(value)
+            sep_length = len(sep)
+            key_pad = key_max + sep_length
+            value_pad = utils.pad_number(value_max + sep_length)
+
+            # Look these up once rather than for every line
+            message = self.message
+            get_formatting = self.__get_formatting_from
+            format_entry = self.__format_summary_entry
+            option_styling = InteractiveLogger.DIRECT_OPTION
+            for key, value, *params in items:
+                formatting = get_formatting(params)
+                
+                if formatting.key:
+                    message(prefix + format_entry(key, value, key_pad=key_pad, value_pad=value_pad, sep=sep), styling=formatting.styling, end='')
+                    message(formatting.key + formatting.line_padding, styling=option_styling)
+                else:
+                    message(prefix + format_entry(key, value, key_pad=key_pad, value_pad=value_pad, sep=sep) + formatting.line_padding, styling=formatting.styling)
+                num_lines += 1
+            self.message()
             num_lines += 1
-        self.message()
-        num_lines += 1
         return num_lines
 
 
     def __get_formatting_from(self, params):
         if (len(params) > 1):
             raise ValueError('extra parameters encountered')
-        result = {}
         if params:
-            result = params.pop(0)
-        if 'styling' not in result:
-            result['styling'] = Logger.DEBUG
-        if 'key' not in result:
-            result['key'] = None
-        if 'line_padding' not in result:
-            result['line_padding'] = ''
-        return result
+            return params[0]
+        return self.DEFAULT_SUMMARY_FORMAT
 
 
-    def add_summary_value(self, summary, title, value, format_func=None, validation_func=None, format_dict=None, error=None, extended=True):
+    def add_summary_value(self, summary, title, value, format_func=None, validation_func=None, summary_format=None, error=None, extended=True):
         '''
         Add summary item to the summary, will be formatted using optional
         function if one has been supplied.
@@ -183,8 +239,13 @@ class InteractiveContext(Context):
         expected data formats. Such routines by default will be run in their
         extended versions.
         '''
-        if not format_dict:
-            format_dict = {}
+        if summary_format is None:
+            summary_format = self.DEFAULT_SUMMARY_FORMAT
+
+        # Nothing to validate or format, so the value can be added as-is
+        if validation_func is None and format_func is None and not error:
+            summary.append([title, value, summary_format])
+            return
 
         try:
             if validation_func:
@@ -195,53 +256,58 @@ class InteractiveContext(Context):
             error = str(e)
 
         if error:
-            format_dict['styling'] = Logger.ERROR
-        summary.append([title, value, format_dict])
+            summary_format = summary_format._replace(styling=Logger.ERROR)
+        summary.append([title, value, summary_format])
         if error:
-            summary.append([self.SUBKEY_INDENT + self.SUBKEY_CHILD + 'ERROR', error, { 'styling': InteractiveLogger.DIRECT_HIGHLIGHT }])
+            summary.append([self.CHILD_ERROR, error, SummaryFormat(styling=InteractiveLogger.DIRECT_HIGHLIGHT)])
     
 
-    def add_summary_config(self, summary, title, config_key, format_func=None, validation_func=None, format_dict=None, error=None):
+    def add_summary_config(self, summary, title, config_key, format_func=None, validation_func=None, summary_format=None, error=None):
         '''
         Add summary item that should be read from the configuration.
         '''
         value = self.fan_config.settings.get(self.section, config_key)
-        self.add_summary_value(summary, title, value, format_func=format_func, validation_func=validation_func, format_dict=format_dict, error=error)
+        self.add_summary_value(summary, title, value, format_func=format_func, validation_func=validation_func, summary_format=summary_format, error=error)
 
 
-    def validate_number(self, value, extended=True):
+    @classmethod
+    def validate_number(cls, value, extended=True):
         try:
             value = int(value)
         except ValueError:
-            raise PromptValidationException('not a number')
+            raise PromptValidationException(cls.INVALID_NUMBER)
         return value
     
 
-    def validate_temp(self, value, extended=True):
-        value = self.validate_number(value, True)
+    @classmethod
+    def validate_temp(cls, value, extended=True):
+        value = cls.validate_number(value, True)
         if value < Fan.SENSOR_MIN:
-            raise PromptValidationException('less than ' + str(Fan.SENSOR_MIN))
+            raise PromptValidationException(cls.INVALID_TEMP_MIN)
         return value
 
 
-    def validate_pwm(self, value, extended=True):
-        value = self.validate_number(value, True)
+    @classmethod
+    def validate_pwm(cls, value, extended=True):
+        value = cls.validate_number(value, True)
         if extended:
             if value < Fan.PWM_MIN:
-                raise PromptValidationException('less than ' + str(Fan.PWM_MIN))
+                raise PromptValidationException(cls.INVALID_PWM_MIN)
             if value > Fan.PWM_MAX:
-                raise PromptValidationException('greater than ' + str(Fan.PWM_MAX))
+                raise PromptValidationException(cls.INVALID_PWM_MAX)
         return value
 
 
-    def validate_string(self, value, extended=True):
+    @staticmethod
+    def validate_string(value, extended=True):
         if not value:
             raise PromptValidationException('empty value')
         return value
 
 
-    def validate_hwmon_provider(self, value, extended=True):
-        value = self.validate_string(value)
+    @classmethod
+    def validate_hwmon_provider(cls, value, extended=True):
+        value = cls.validate_string(value)
         hwmon_provider = HwmonProvider.resolve_provider(value)
         if not hwmon_provider:
             raise PromptValidationException('invalid value')
@@ -259,7 +325,8 @@ class InteractiveContext(Context):
         return hwmon_object.get_title(include_summary=True)
 
 
-    def validate_exists(self, value, extended=True):
+    @staticmethod
+    def validate_exists(value, extended=True):
         if value is None:
             raise PromptValidationException('doesn\'t have a value')
         return value
@@ -267,8 +334,8 @@ class InteractiveContext(Context):
 
     def __format_summary_entry(self, key, value, key_pad=16, value_pad=0, sep=' '):
         if key_pad:
-            return (key + sep).ljust(key_pad) + str(value).ljust(value_pad)
-        return (key + sep) + str(value)
+            return f'{key + sep:<{key_pad}}{value!s:<{value_pad}}'
+        return f'{key}{sep}{value}'
 
 
     def confirm_exit(self):
@@ -283,19 +350,16 @@ class InteractiveContext(Context):
         return self.parent
 
 
-    def toggle_from_list(self, list, current, default):
+    def toggle_from_list(self, items, current, default):
         '''
-        Used when stepping through possible values, one after another. Makes
-        a copy so that we don't destroy anything valuable. Wraps around as
-        needed.
+        Used when stepping through possible values, one after another. Wraps
+        around to the first value as needed.
         '''
-        methods = list.copy()
         try:
-            methods.append(methods[0])
-            index = methods.index(current)
-            return methods[index + 1]
+            index = items.index(current)
         except ValueError:
             return default
+        return items[(index + 1) % len(items)]
 
 
     def expain_setting(self, name, value, description):
@@ -317,14 +381,18 @@ class InteractiveContext(Context):
         if isinstance(current_object, HwmonObject):
             selected_provider = current_object.hwmon_provider
 
-        self.message('Listing hwmon:', styling=InteractiveLogger.DIRECT_HIGHLIGHT)
-        if hwmon_providers:
-            for provider in hwmon_providers:
-                styling = InteractiveLogger.DIRECT_HIGHLIGHT if selected_provider is provider else Logger.DEBUG
-                self.message(self.SUBKEY_INDENT + provider.get_title(include_summary=True), styling=styling)
-        else:
-            self.error(self.SUBKEY_INDENT + 'No suitable hwmon entries found. Has a suitable driver been loaded?')
-        self.message()
+        with self.buffered_output():
+            self.message('Listing hwmon:', styling=InteractiveLogger.DIRECT_HIGHLIGHT)
+            if hwmon_providers:
+                message = self.message
+                indent = self.SUBKEY_INDENT
+                highlight = InteractiveLogger.DIRECT_HIGHLIGHT
+                for provider in hwmon_providers:
+                    styling = highlight if selected_provider is provider else Logger.DEBUG
+                    message(indent + provider.get_title(include_summary=True), styling=styling)
+                message()
+            else:
+                self.error(self.SUBKEY_INDENT + 'No suitable hwmon entries found. Has a suitable driver been loaded?', end='\n\n')
 
 
     def hwmon_select_provider(self, hwmon_providers, current_object):
@@ -332,72 +400,80 @@ class InteractiveContext(Context):
         Prompt the user to select an instance of HwmonInfo, a suitable list can
         be loaded using hwmon_load-method.
         '''
+        # Nothing to choose from, the listing will already have said as much
+        if not hwmon_providers:
+            return None
+
         selected_provider = current_object
         if isinstance(current_object, HwmonObject):
             selected_provider = current_object.get_provider()
 
         choices = {}
+        first_key = None
         builder = PromptBuilder(self.console)
         builder.add_cancel()
         for provider in hwmon_providers:
             is_current = provider is selected_provider
             key = builder.set_next(provider.get_title(include_summary=False), start_at=provider.suggest_key(), highlight=is_current)
             choices[key] = provider
+            if first_key is None:
+                first_key = key
             if is_current:
                 builder.set_default(key)
 
         # Automatically use first choice as default if we don't have any other
         # options. This means that we can just hit ENTER and be done with it.
         if len(choices) == 1 and builder.get_default() is None:
-            first_key = next(iter(choices.keys()))
             builder.set_default(first_key)
 
         selected = self.console.prompt_choices(builder, prompt='Select hwmon')
-        match selected:
-            case None | 'x':
-                return None
-            case _:
-                return choices[selected]
-        return None
+        if selected is None or selected == 'x':
+            return None
+        return choices[selected]
 
 
     def hwmon_list_objects(self, hwmon_entries, current_object):
-        self.message('Listing entries:', styling=InteractiveLogger.DIRECT_HIGHLIGHT)
-        if hwmon_entries:
-            for entry in hwmon_entries:
-                styling = InteractiveLogger.DIRECT_HIGHLIGHT if entry is current_object else Logger.DEBUG
-                self.message(self.SUBKEY_INDENT + entry.get_title(include_summary=True), styling=styling)
-        else:
-            self.error(self.SUBKEY_INDENT + 'No suitable hwmon entries found. Has a suitable driver been loaded?')
-        self.message()
+        with self.buffered_output():
+            self.message('Listing entries:', styling=InteractiveLogger.DIRECT_HIGHLIGHT)
+            if hwmon_entries:
+                message = self.message
+                indent = self.SUBKEY_INDENT
+                highlight = InteractiveLogger.DIRECT_HIGHLIGHT
+                for entry in hwmon_entries:
+                    styling = highlight if entry is current_object else Logger.DEBUG
+                    message(indent + entry.get_title(include_summary=True), styling=styling)
+                message()
+            else:
+                self.error(self.SUBKEY_INDENT + 'No suitable hwmon entries found. Has a suitable driver been loaded?', end='\n\n')
 
 
     def hwmon_select_object(self, hwmon_objects, current_object, prompt='Select resource'):
         self.hwmon_list_objects(hwmon_objects, current_object)
+        if not hwmon_objects:
+            return None
 
         choices = {}
+        first_key = None
         builder = PromptBuilder(self.console)
         builder.add_cancel()
         for entry in hwmon_objects:
             is_current = (entry is current_object)
             key = builder.set_next(entry.get_title(include_summary=False), start_at=entry.suggest_key(), highlight=is_current)
             choices[key] = entry
+            if first_key is None:
+                first_key = key
             if is_current:
                 builder.set_default(key)
 
         # Automatically use first choice as default if we don't have any other
         # options. This means that we can just hit ENTER and be done with it.
         if len(choices) == 1 and builder.get_default() is None:
-            first_key = next(iter(choices.keys()))
             builder.set_default(first_key)
 
         selected = self.console.prompt_choices(builder, prompt=prompt)
-        match selected:
-            case None | 'x':
-                return None
-            case _:
-                return choices[selected]
-        return None
+        if selected is None or selected == 'x':
+            return None
+        return choices[selected]
 
 
     def print_error(self, exception, title='Exception'):
@@ -410,7 +486,7 @@ class InteractiveContext(Context):
 
     @staticmethod
     def format_delay(value):
-        return 'Controller updates every {} seconds'.format(value)
+        return f'Controller updates every {value} seconds'
     
 
     @staticmethod
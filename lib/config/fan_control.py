@@ -1,5 +1,5 @@
-import time, itertools
-from ..logger import Logger, InteractiveLogger, PromptBuilder, ConfirmPromptBuilder
+import time
+from ..logger import Logger, InteractiveLogger, PromptBuilder
 from ..exceptions import SensorException, ControlRuntimeError, SchedulerLimitExceeded
 from ..control import PWMSensor
 from ..scheduler import MicroScheduler
@@ -24,8 +24,13 @@ class ControlFanContext(InteractiveContext):
     def __init__(self, *args, fan):
         super().__init__(*args)
         self.fan = fan
+        self.manual_title = fan.device.format_enable(PWMSensor.PWM_ENABLE_MANUAL)
+        self.auto_title = fan.device.format_enable(PWMSensor.PWM_ENABLE_AUTO)
         self.original_enable = None
         self.original_value = None
+        self.enable_written = False
+        self.value_written = False
+        self.last_written_value = None
         self.managing = False
 
 
@@ -44,10 +49,12 @@ class ControlFanContext(InteractiveContext):
         try:
             self.__save_state()
 
+            # Options don't change while we're here, so only build them once
+            builder = self.__get_prompt_builder()
             while True:
                 self.summary()
 
-                input = self.console.prompt_choices(self.__get_prompt_builder(), prompt=self.get_prompt(), auto_select=auto_select)
+                input = self.console.prompt_choices(builder, prompt=self.get_prompt(), auto_select=auto_select)
                 result, key = self.__match_actions(input, auto_select)
             
                 if result == self:
@@ -61,12 +68,8 @@ class ControlFanContext(InteractiveContext):
 
 
     def get_prompt(self):
-        terms = [ self.fan.get_title() ]
-        if self.managing:
-            terms.append(self.fan.device.format_enable(PWMSensor.PWM_ENABLE_MANUAL))
-        else:
-            terms.append(self.fan.device.format_enable(PWMSensor.PWM_ENABLE_AUTO))
-        return ' '.join(terms)
+        enable_title = self.manual_title if self.managing else self.auto_title
+        return f'{self.fan.get_title()} {enable_title}'
 
 
     def summary(self, items=None, sep=': ', prefix=InteractiveContext.SUBKEY_INDENT):
@@ -77,21 +80,21 @@ class ControlFanContext(InteractiveContext):
         
         self.add_summary_value(items, self.NAME, self.fan.get_title())
         self.add_summary_value(items, self.DEVICE, self.fan.device, format_func=self.format_resource, validation_func=self.validate_exists)
-        self.add_summary_value(items, self.SUBKEY_CHILD + self.MINIMUM, self.fan.pwm_min, format_func=utils.format_pwm, validation_func=self.validate_exists)
-        self.add_summary_value(items, self.SUBKEY_CHILD + self.MAXIMUM, self.fan.pwm_max, format_func=utils.format_pwm, validation_func=self.validate_exists)
-        self.add_summary_value(items, self.SUBKEY_CHILD + self.START, self.fan.pwm_start, format_func=utils.format_pwm, validation_func=self.validate_exists)
-        self.add_summary_value(items, self.SUBKEY_CHILD + self.STOP, self.fan.pwm_stop, format_func=utils.format_pwm, validation_func=self.validate_exists)
+        self.add_summary_value(items, self.CHILD_MINIMUM, self.fan.pwm_min, format_func=utils.format_pwm, validation_func=self.validate_exists)
+        self.add_summary_value(items, self.CHILD_MAXIMUM, self.fan.pwm_max, format_func=utils.format_pwm, validation_func=self.validate_exists)
+        self.add_summary_value(items, self.CHILD_START, self.fan.pwm_start, format_func=utils.format_pwm, validation_func=self.validate_exists)
+        self.add_summary_value(items, self.CHILD_STOP, self.fan.pwm_stop, format_func=utils.format_pwm, validation_func=self.validate_exists)
         self.add_summary_value(items, self.SENSOR, self.fan.sensor, format_func=self.format_resource, validation_func=self.validate_exists)
-        self.add_summary_value(items, self.SUBKEY_CHILD + self.MINIMUM, self.fan.sensor_min, format_func=utils.format_celsius, validation_func=self.validate_exists)
-        self.add_summary_value(items, self.SUBKEY_CHILD + self.MAXIMUM, self.fan.sensor_max, format_func=utils.format_celsius, validation_func=self.validate_exists)
+        self.add_summary_value(items, self.CHILD_MINIMUM, self.fan.sensor_min, format_func=utils.format_celsius, validation_func=self.validate_exists)
+        self.add_summary_value(items, self.CHILD_MAXIMUM, self.fan.sensor_max, format_func=utils.format_celsius, validation_func=self.validate_exists)
         self.add_summary_value(items, self.PWM_INPUT, self.fan.pwm_input, format_func=self.format_resource, validation_func=self.validate_exists)
         return super().summary(items, sep, prefix)
 
 
     def __get_prompt_builder(self):
         builder = PromptBuilder(self.console)
-        builder.set(self.KEY_SET_MANAGED, self.to_sentence(self.SET, utils.Acronym(self.fan.device.format_enable(PWMSensor.PWM_ENABLE_MANUAL))))
-        builder.set(self.KEY_SET_CHIPSET, self.to_sentence(self.SET, utils.Acronym(self.fan.device.format_enable(PWMSensor.PWM_ENABLE_AUTO))))
+        builder.set(self.KEY_SET_MANAGED, self.to_sentence(self.SET, utils.Acronym(self.manual_title)))
+        builder.set(self.KEY_SET_CHIPSET, self.to_sentence(self.SET, utils.Acronym(self.auto_title)))
         builder.set(self.KEY_SET_FULL, 'Set to full')
         builder.set(self.KEY_SET_ZERO, 'Set to zero')
         builder.set(self.KEY_SET_REFRESH, 'Refresh')
@@ -180,10 +183,10 @@ class ControlFanContext(InteractiveContext):
         self.message()
         items = []
 
-        TemperatureSpan.reset()
+        spans = TemperatureSpanList()
         for temperature in range(temp_from, temp_to+1, 5):
-            TemperatureSpan.add(temperature, self.fan.simulate(temperature, 100).target_value)
-        for result in TemperatureSpan.get():
+            spans.add(temperature, self.fan.simulate(temperature, 100).target_value)
+        for result in spans.get():
             self.add_summary_value(items, result.get_description(), result.get_value(), validation_func=self.validate_exists)
         return super().summary(items, title='Simulation results')
 
@@ -200,7 +203,7 @@ class ControlFanContext(InteractiveContext):
             'operations in order to determine the physical behavior of it, '
             'quite possibly leaving you with insufficient cooling. Do NOT '
             'continue unless you know what this means for your system.'
-        ).format(self.fan.device.format_enable(PWMSensor.PWM_ENABLE_MANUAL))
+        ).format(self.manual_title)
         if not self.confirm_warning(warning, auto_select=auto_select):
             return False
         try:
@@ -240,11 +243,12 @@ class ControlFanContext(InteractiveContext):
         self.fan.pwm_start = device_start
         self.fan.pwm_stop = device_stop
 
-        self.fan_config.settings.set(self.fan.name, 'pwm_min', device_min)
-        self.fan_config.settings.set(self.fan.name, 'pwm_max', device_max)
-        self.fan_config.settings.set(self.fan.name, 'pwm_start', device_start)
-        self.fan_config.settings.set(self.fan.name, 'pwm_stop', device_stop)
-        self.fan_config.settings.save()
+        settings = self.fan_config.settings
+        settings.set(self.fan.name, 'pwm_min', device_min)
+        settings.set(self.fan.name, 'pwm_max', device_max)
+        settings.set(self.fan.name, 'pwm_start', device_start)
+        settings.set(self.fan.name, 'pwm_stop', device_stop)
+        settings.save()
 
 
     def __perform_testing(self, device_min, device_max, step_size=10):
@@ -330,7 +334,9 @@ class ControlFanContext(InteractiveContext):
                         raise
                     return False
             else:
-                time.sleep(.3)
+                # Sleep until the next step, but keep checking at regular
+                # intervals when the steps are long.
+                time.sleep(min(.3, scheduler.time_remaining()))
             if check_completed_func is not None:
                 result = check_completed_func()
                 if result:
@@ -374,7 +380,7 @@ class ControlFanContext(InteractiveContext):
         warning = (
             'WARNING! In order to perform this action, control over the fan '
             'needs to set to {}.'
-        ).format(self.fan.device.format_enable(PWMSensor.PWM_ENABLE_MANUAL))
+        ).format(self.manual_title)
 
         if self.confirm_warning(warning):
             self.__handle_set_enable(PWMSensor.PWM_ENABLE_MANUAL)
@@ -386,6 +392,9 @@ class ControlFanContext(InteractiveContext):
         self.original_enable = self.__read_enable()
         self.managing = (self.original_enable == PWMSensor.PWM_ENABLE_MANUAL)
         self.original_value = self.__read_value()
+        self.enable_written = False
+        self.value_written = False
+        self.last_written_value = None
 
 
     def __read_enable(self):
@@ -393,6 +402,7 @@ class ControlFanContext(InteractiveContext):
 
 
     def __write_enable(self, value, ignore_exceptions=False):
+        self.enable_written = True
         return self.fan.device.write_enable(value, ignore_exceptions)
 
 
@@ -405,18 +415,40 @@ class ControlFanContext(InteractiveContext):
 
 
     def __write_value(self, value, ignore_exceptions=False):
-        return self.fan.device.write_value(value, ignore_exceptions)
+        self.value_written = True
+        self.last_written_value = None
+        if not self.fan.device.write_value(value, ignore_exceptions):
+            return False
+        self.last_written_value = value
+        return True
+
+
+    def __value_changed(self):
+        '''
+        Check if the PWM value may have changed since entering. When the enable
+        mode was left alone and our last successful write was the original
+        value we trust that write, some drivers are slow to reflect a change
+        so reading it back could report a stale value.
+        '''
+        if self.enable_written:
+            return True
+        return self.value_written and self.last_written_value != self.original_value
 
 
     def __restore_state(self):
+        '''
+        Restore the values saved on entry, but only check them if we've
+        written to the device since then. Changing the enable mode may let the
+        chipset change the value, so that counts as a change to both.
+        '''
         changes = False
-        if self.original_value is not None:
+        if self.original_value is not None and self.__value_changed():
             if not self.__read_value() == self.original_value:
                 changes = True
                 self.__write_value(self.original_value, ignore_exceptions=True)
                 self.message('Restored original value: {}'.format(self.original_value))
 
-        if self.original_enable is not None:
+        if self.original_enable is not None and self.enable_written:
             if not self.__read_enable() == self.original_enable:
                 changes = True
                 self.__write_enable(self.original_enable, ignore_exceptions=True)
@@ -426,6 +458,9 @@ class ControlFanContext(InteractiveContext):
 
 
 class TestContextManager:
+    __slots__ = ('context', 'message', 'styling', 'status_ok', 'status_fail', 'inline', 'parent', 'indent_number', 'indent', 'status')
+
+
     def __init__(self, context, message, styling=InteractiveLogger.DIRECT_REGULAR, status_ok='OK', status_fail='FAILED', inline=True, parent_context=None):
         self.context = context
         self.message = message
@@ -437,6 +472,7 @@ class TestContextManager:
         self.indent_number = 0
         if parent_context:
             self.indent_number = parent_context.next_indent()
+        self.indent = self.get_indent()
         self.status = None
 
 
@@ -446,11 +482,16 @@ class TestContextManager:
 
     def get_result(self, result):
         if self.status:
-            result = '{} ({})'.format(result, self.status)
+            result = f'{result} ({self.status})'
         return result
 
 
     def get_indent(self):
+        '''
+        Build the prefix used when outputting messages at this depth. The depth
+        doesn't change, so it's only called once from __init__ with the result
+        kept in self.indent.
+        '''
         if self.indent_number == 0:
             return ''
         if self.indent_number == 1:
@@ -467,22 +508,22 @@ class TestContextManager:
         if self.inline:
             self.context.message(message, styling=Logger.DEBUG, end=' ')
             return
-        message = '{}{}'.format(self.get_indent(), message)
+        message = f'{self.indent}{message}'
         self.context.message(message, styling=Logger.DEBUG)
 
 
     def __enter__(self):
         end = '' if self.inline else '\n'
-        self.context.message('{}{}... '.format(self.get_indent(), self.message), styling=self.styling, end=end)
+        self.context.message(f'{self.indent}{self.message}... ', styling=self.styling, end=end)
         return self
 
 
     def __exit__(self, exc_type, exc_value, traceback):
-        prefix = '' if self.inline else self.get_indent() + '... '
+        prefix = '' if self.inline else self.indent + '... '
         if exc_type is None:
-            self.context.message('{}{}'.format(prefix, self.get_result(self.status_ok)), styling=self.styling)
+            self.context.message(prefix + self.get_result(self.status_ok), styling=self.styling)
         else:
-            self.context.message('{}{}'.format(prefix, self.get_result(self.status_fail)), styling=self.styling)
+            self.context.message(prefix + self.get_result(self.status_fail), styling=self.styling)
         return False
 
 
@@ -493,7 +534,7 @@ class TestAbortedException(ControlRuntimeError):
 
 
 class TemperatureSpan:
-    instances = []
+    __slots__ = ('start_at', 'stop_at', 'value')
 
 
     def __init__(self, start_at, value):
@@ -513,24 +554,27 @@ class TemperatureSpan:
         return utils.format_pwm(self.value)
 
 
-    @classmethod
-    def add(cls, temperature, value, fill_gaps=True):
-        if not cls.instances:
-            cls.instances.append(cls(start_at=temperature, value=value))
-        last = cls.instances[-1]
+class TemperatureSpanList:
+    '''
+    Collects simulated values as they're added, temperatures sharing the same
+    value are grouped into a single TemperatureSpan. A new list is used for
+    each simulation, and temperatures are expected in ascending order.
+    '''
+    def __init__(self):
+        self.spans = []
+
+
+    def add(self, temperature, value, fill_gaps=True):
+        if not self.spans:
+            self.spans.append(TemperatureSpan(start_at=temperature, value=value))
+        last = self.spans[-1]
         if last.value == value:
             last.stop_at = temperature
         else:
-            if fill_gaps and last.stop_at < (temperature - 1):
+            if fill_gaps:
                 last.stop_at = temperature - 1
-            cls.instances.append(cls(start_at=temperature, value=value))
-
-
-    @classmethod
-    def get(cls):
-        return cls.instances
+            self.spans.append(TemperatureSpan(start_at=temperature, value=value))
 
 
-    @classmethod
-    def reset(cls):
-        cls.instances.clear()
\ No newline at end of file
+    def get(self):
+        return self.spans
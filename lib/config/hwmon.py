@@ -36,7 +36,8 @@ class HWMONContext(InteractiveContext):
         return super().summary(items, sep, prefix)
 
 
-    def __is_suitable(self, hwmon_provider):
+    @staticmethod
+    def __is_suitable(hwmon_provider):
         return hwmon_provider.devices and hwmon_provider.sensors and hwmon_provider.pwm_inputs
 
 
@@ -55,14 +56,15 @@ class HWMONContext(InteractiveContext):
         self.message('Changing to {}:'.format(str(hwmon_provider)), styling=InteractiveLogger.DIRECT_HIGHLIGHT)
         self.message(self.SUBKEY_CHILD + 'Fan configurations will be disabled.', styling=Logger.DEBUG, end='\n\n')
         if self.console.prompt_choices(ConfirmPromptBuilder(self.console), prompt=self.CONFIRM_CHANGE) == 'y':
-            self.fan_config.settings.set('Settings', 'dev_base', hwmon_provider.name)
-            self.fan_config.settings.set('Settings', 'dev_name', hwmon_provider.get_driver_name())
-            self.fan_config.settings.set('Settings', 'dev_path', hwmon_provider.get_driver_path())
+            settings = self.fan_config.settings
+            settings.set('Settings', 'dev_base', hwmon_provider.name)
+            settings.set('Settings', 'dev_name', hwmon_provider.get_driver_name())
+            settings.set('Settings', 'dev_path', hwmon_provider.get_driver_path())
 
-            for section in self.fan_config.settings.sections():
-                self.fan_config.settings.set_enabled(section, False)
+            for section in settings.sections():
+                settings.set_enabled(section, False)
 
-            self.fan_config.settings.save()
+            settings.save()
             self.message(self.CONFIG_UPDATED, end='\n\n')
 
 
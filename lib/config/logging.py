@@ -7,6 +7,8 @@ class LoggingContext(InteractiveContext):
     LOG_FORMATTING = 'Log formatting'
     LOG_LEVEL = 'Log level'
     LOG_USING = 'Log using'
+    CHILD_LOG_FORMATTING = InteractiveContext.SUBKEY_CHILD + LOG_FORMATTING
+    CHILD_LOG_LEVEL = InteractiveContext.SUBKEY_CHILD + LOG_LEVEL
 
     def __init__(self, *args):
         super().__init__(*args)
@@ -14,29 +16,30 @@ class LoggingContext(InteractiveContext):
 
     def interact(self, auto_select=None):
         self.summary()
+        settings = self.fan_config.settings
 
         input = self.console.prompt_choices(self.__get_prompt_builder(), prompt=self, auto_select=auto_select)
         match input:
             case None | 'x':
                 return self.parent
             case 'e':
-                self.__explain_using(self.LOG_USING, self.fan_config.settings.log_using)
-                self.__explain_formatter(self.LOG_FORMATTING, self.fan_config.settings.log_formatter)
-                self.__explain_level(self.LOG_LEVEL, self.fan_config.settings.log_level)
+                self.__explain_using(self.LOG_USING, settings.log_using)
+                self.__explain_formatter(self.LOG_FORMATTING, settings.log_formatter)
+                self.__explain_level(self.LOG_LEVEL, settings.log_level)
             case 'l':
-                value = self.__toggle_level(self.fan_config.settings.log_level)
-                self.fan_config.settings.set('Settings', 'log_level', value)
-                self.fan_config.settings.save()
+                value = self.__toggle_level(settings.log_level)
+                settings.set('Settings', 'log_level', value)
+                settings.save()
                 self.__explain_level(self.LOG_LEVEL, value)
             case 'f':
-                value = self.__toggle_formatter(self.fan_config.settings.log_formatter)
-                self.fan_config.settings.set('Settings', 'log_formatter', value)
-                self.fan_config.settings.save()
+                value = self.__toggle_formatter(settings.log_formatter)
+                settings.set('Settings', 'log_formatter', value)
+                settings.save()
                 self.__explain_formatter(self.LOG_FORMATTING, value)
             case 'u':
-                value = self.__toggle_using(self.fan_config.settings.log_using)
-                self.fan_config.settings.set('Settings', 'log_using', value)
-                self.fan_config.settings.save()
+                value = self.__toggle_using(settings.log_using)
+                settings.set('Settings', 'log_using', value)
+                settings.save()
                 self.__explain_using(self.LOG_USING, value)
         return self
 
@@ -1,6 +1,5 @@
 from ..logger import PromptBuilder
 from ..exceptions import ConfigurationError
-from .. import PACKAGE
 from .context import InteractiveContext
 from .logging import LoggingContext
 from .main_loaded import MainLoadedContext
@@ -34,16 +33,16 @@ class MainContext(InteractiveContext):
 
         self.add_summary_config(items, 'Delay', 'delay', format_func=MainLoadedContext.format_delay, validation_func=self.validate_string)
         self.add_summary_config(items, 'Device', 'dev_base', validation_func=self.validate_string)
-        self.add_summary_config(items, self.SUBKEY_CHILD + 'Path checked', 'dev_path', validation_func=self.validate_string)
-        self.add_summary_config(items, self.SUBKEY_CHILD + 'Driver checked', 'dev_name', validation_func=self.validate_string)
+        self.add_summary_config(items, self.CHILD_PATH_CHECKED, 'dev_path', validation_func=self.validate_string)
+        self.add_summary_config(items, self.CHILD_DRIVER_CHECKED, 'dev_name', validation_func=self.validate_string)
         self.add_summary_logging(items)
         return super().summary(items, sep, prefix)
 
 
     def add_summary_logging(self, items):
         self.add_summary_config(items, LoggingContext.LOG_USING, 'log_using')
-        self.add_summary_config(items, self.SUBKEY_CHILD + LoggingContext.LOG_FORMATTING, 'log_formatter', validation_func=self.validate_string)
-        self.add_summary_config(items, self.SUBKEY_CHILD + LoggingContext.LOG_LEVEL, 'log_level', validation_func=self.validate_string)
+        self.add_summary_config(items, LoggingContext.CHILD_LOG_FORMATTING, 'log_formatter', validation_func=self.validate_string)
+        self.add_summary_config(items, LoggingContext.CHILD_LOG_LEVEL, 'log_level', validation_func=self.validate_string)
 
 
     def __get_prompt_builder(self):
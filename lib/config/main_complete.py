@@ -1,6 +1,6 @@
-import time
+import time, functools
 from ..logger import Logger, InteractiveLogger, PromptBuilder, ANSIContext
-from .context import InteractiveContext
+from .context import InteractiveContext, SummaryFormat
 from .fan_control import ControlFanContext
 from .. import utils
 
@@ -19,7 +19,7 @@ class MainCompleteContext(InteractiveContext):
                 self.watch_fans(fan_list=self.fan_config.fans)
             case _:
                 fan = self.prompt_values[input]
-                self.message('Fan {} selected'.format(fan.get_title()), end='\n\n')
+                self.message(f'Fan {fan.get_title()} selected', end='\n\n')
                 return ControlFanContext(self.fan_config, self, fan=fan)
         return self
 
@@ -32,8 +32,8 @@ class MainCompleteContext(InteractiveContext):
 
         self.add_summary_value(items, self.DELAY, self.fan_config.delay, format_func=self.format_delay, validation_func=self.validate_exists)
         self.add_summary_value(items, self.DEVICE, self.fan_config.dev_base.get_title(include_summary=True), validation_func=self.validate_exists)
-        self.add_summary_value(items, self.SUBKEY_CHILD + 'Path checked', self.fan_config.dev_path, validation_func=self.validate_exists)
-        self.add_summary_value(items, self.SUBKEY_CHILD + 'Driver checked', self.fan_config.dev_name, validation_func=self.validate_exists)
+        self.add_summary_value(items, self.CHILD_PATH_CHECKED, self.fan_config.dev_path, validation_func=self.validate_exists)
+        self.add_summary_value(items, self.CHILD_DRIVER_CHECKED, self.fan_config.dev_name, validation_func=self.validate_exists)
         return super().summary(items, sep, prefix)
 
 
@@ -46,10 +46,11 @@ class MainCompleteContext(InteractiveContext):
 
 
     def __list_fans(self):
-        self.message('Listing available definitions:', styling=InteractiveLogger.DIRECT_HIGHLIGHT)
-        for fan in self.fan_config.fans:
-            self.message(self.SUBKEY_INDENT + fan.get_title(include_summary=True), styling=Logger.DEBUG)
-        self.message()
+        with self.buffered_output():
+            self.message('Listing available definitions:', styling=InteractiveLogger.DIRECT_HIGHLIGHT)
+            for fan in self.fan_config.fans:
+                self.message(self.SUBKEY_INDENT + fan.get_title(include_summary=True), styling=Logger.DEBUG)
+            self.message()
 
 
     def __add_fan_options(self, builder):
@@ -63,28 +64,30 @@ class MainCompleteContext(InteractiveContext):
         self.message()
         with ANSIContext(self.console, ANSIContext.CURSOR_HIDE, ANSIContext.CURSOR_SHOW):
             line_padding = ' '*5
+            summary_format = SummaryFormat(line_padding=line_padding)
+            status_message = f"Updating sensors in {update_seconds} {utils.to_plural('second', count=update_seconds)}, Ctrl+C to abort"
             step_number = 1
+            num_lines = 0
             while True:
                 try:
-                    num_lines = 0
-                    for fan in fan_list:
-                        items = []
-                        self.add_summary_value(items, self.DEVICE, fan.device, format_func=self.format_resource, validation_func=self.validate_exists, format_dict={ 'line_padding': line_padding })
-                        self.add_summary_value(items, self.SENSOR, fan.sensor, format_func=self.format_resource, validation_func=self.validate_exists, format_dict={ 'line_padding': line_padding })
-                        self.add_summary_value(items, self.PWM_INPUT, fan.pwm_input, format_func=self.format_resource, validation_func=self.validate_exists, format_dict={ 'line_padding': line_padding })
-                        num_lines += super().summary(items, sep, prefix, title=fan.get_title())
-                    self.message(
-                        'Updating sensors in {} {}, Ctrl+C to abort{}{}'.format(
-                            update_seconds, 
-                            utils.to_plural('second', count=update_seconds),
-                            '.'*step_number,
-                            line_padding
-                        ),
-                        InteractiveLogger.DIRECT_PROMPT
-                    )
+                    # Each update is written in one go, including moving back
+                    # up over the previous one, so that it's redrawn in place.
+                    with self.buffered_output():
+                        if num_lines:
+                            self.console.move_cursor_up(count=num_lines, clear_line=False)
+                        num_lines = 0
+                        # Fans often share sensors, so each one is only read
+                        # once per update.
+                        format_resource = functools.cache(self.format_resource)
+                        for fan in fan_list:
+                            items = []
+                            self.add_summary_value(items, self.DEVICE, fan.device, format_func=format_resource, validation_func=self.validate_exists, summary_format=summary_format)
+                            self.add_summary_value(items, self.SENSOR, fan.sensor, format_func=format_resource, validation_func=self.validate_exists, summary_format=summary_format)
+                            self.add_summary_value(items, self.PWM_INPUT, fan.pwm_input, format_func=format_resource, validation_func=self.validate_exists, summary_format=summary_format)
+                            num_lines += super().summary(items, sep, prefix, title=fan.get_title())
+                        self.message(f'{status_message}{"."*step_number}{line_padding}', InteractiveLogger.DIRECT_PROMPT)
                     step_number = 1 if step_number == 3 else step_number + 1
                     num_lines += 1
                     time.sleep(update_seconds)
-                    self.console.move_cursor_up(count=num_lines, clear_line=False)
                 except KeyboardInterrupt:
                     return
\ No newline at end of file
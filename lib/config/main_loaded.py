@@ -29,7 +29,7 @@ class MainLoadedContext(InteractiveContext):
                 return SectionContext(self.fan_config, self, section=str(uuid.uuid4())).create()
             case _:
                 section = self.prompt_values[input]
-                self.message('Fan definition {} selected.'.format(section), end='\n\n')
+                self.message(f'Fan definition {section} selected.', end='\n\n')
                 return SectionContext(self.fan_config, self, section=section)
         return self
 
@@ -42,42 +42,42 @@ class MainLoadedContext(InteractiveContext):
 
         self.add_summary_value(items, self.DELAY, self.fan_config.delay, format_func=self.format_delay, validation_func=self.validate_exists)
         self.add_summary_value(items, self.DEVICE, self.fan_config.dev_base.get_title(include_summary=True), validation_func=self.validate_exists)
-        self.add_summary_value(items, self.SUBKEY_CHILD + 'Path checked', self.fan_config.dev_path, validation_func=self.validate_exists)
-        self.add_summary_value(items, self.SUBKEY_CHILD + 'Driver checked', self.fan_config.dev_name, validation_func=self.validate_exists)
+        self.add_summary_value(items, self.CHILD_PATH_CHECKED, self.fan_config.dev_path, validation_func=self.validate_exists)
+        self.add_summary_value(items, self.CHILD_DRIVER_CHECKED, self.fan_config.dev_name, validation_func=self.validate_exists)
         return super().summary(items, sep, prefix)
 
 
     def __load_sections(self):
-        self.sections = []
-        for section in self.fan_config.settings.sections(only_enabled=False):
-            self.sections.append(section)
+        self.sections = self.fan_config.settings.sections(only_enabled=False)
 
 
     def __list_sections(self):
-        self.message('Listing available definitions:', styling=InteractiveLogger.DIRECT_HIGHLIGHT)
-        for section in self.sections:
-            self.__output_section(section)
-        self.message()
+        with self.buffered_output():
+            self.message('Listing available definitions:', styling=InteractiveLogger.DIRECT_HIGHLIGHT)
+            for section in self.sections:
+                self.__output_section(section)
+            self.message()
 
 
     def __output_section(self, section):
+        settings = self.fan_config.settings
         description = section
         terms = []
         styling = Logger.DEBUG
-        if not self.fan_config.settings.is_enabled(section):
+        if not settings.is_enabled(section):
             styling = Logger.WARNING
             terms.append('disabled')
 
         for key in [ 'device', 'sensor', 'pwm_input' ]:
             try:
-                value = self.fan_config.settings.get(section, key)
-                terms.append('{}={}'.format(key, value))
+                value = settings.get(section, key)
+                terms.append(f'{key}={value}')
                 value = self.validate_hwmon_object(value)
             except PromptValidationException as e:
                 styling = Logger.ERROR
 
         if terms:
-            description = '{} ({})'.format(description, ', '.join(terms))
+            description = f"{description} ({', '.join(terms)})"
         self.message(self.SUBKEY_INDENT + description, styling=styling)
 
 
@@ -1,9 +1,8 @@
-import os
 from ..logger import Logger, InteractiveLogger, PromptBuilder, ConfirmPromptBuilder, PromptValidationException
 from ..exceptions import ControlRuntimeError
 from ..hwmon import HwmonProvider
 from .. import utils
-from .context import InteractiveContext
+from .context import InteractiveContext, SummaryFormat
 
 
 class SectionContext(InteractiveContext):
@@ -103,13 +102,13 @@ class SectionContext(InteractiveContext):
         self.add_summary_value(items, self.NAME, self.section)
         self.add_summary_config(items, self.DEVICE, 'device', validation_func=self.validate_hwmon_object)
         self.__add_status(items)
-        self.add_summary_config(items, self.SUBKEY_CHILD + self.MINIMUM, 'pwm_min', format_func=utils.format_pwm, validation_func=self.__validate_pwm_min, format_dict={ 'key': self.KEY_DEVICE_MIN })
-        self.add_summary_config(items, self.SUBKEY_CHILD + self.MAXIMUM, 'pwm_max', format_func=utils.format_pwm, validation_func=self.__validate_pwm_max, format_dict={ 'key': self.KEY_DEVICE_MAX })
-        self.add_summary_config(items, self.SUBKEY_CHILD + self.START, 'pwm_start', format_func=utils.format_pwm, validation_func=self.validate_pwm, format_dict={ 'key': self.KEY_DEVICE_START })
-        self.add_summary_config(items, self.SUBKEY_CHILD + self.STOP, 'pwm_stop', format_func=utils.format_pwm, validation_func=self.__validate_pwm_stop, format_dict={ 'key': self.KEY_DEVICE_STOP })
+        self.add_summary_config(items, self.CHILD_MINIMUM, 'pwm_min', format_func=utils.format_pwm, validation_func=self.__validate_pwm_min, summary_format=SummaryFormat(key=self.KEY_DEVICE_MIN))
+        self.add_summary_config(items, self.CHILD_MAXIMUM, 'pwm_max', format_func=utils.format_pwm, validation_func=self.__validate_pwm_max, summary_format=SummaryFormat(key=self.KEY_DEVICE_MAX))
+        self.add_summary_config(items, self.CHILD_START, 'pwm_start', format_func=utils.format_pwm, validation_func=self.validate_pwm, summary_format=SummaryFormat(key=self.KEY_DEVICE_START))
+        self.add_summary_config(items, self.CHILD_STOP, 'pwm_stop', format_func=utils.format_pwm, validation_func=self.__validate_pwm_stop, summary_format=SummaryFormat(key=self.KEY_DEVICE_STOP))
         self.add_summary_config(items, self.SENSOR, 'sensor', validation_func=self.validate_hwmon_object)
-        self.add_summary_config(items, self.SUBKEY_CHILD + self.MINIMUM, 'sensor_min', format_func=utils.format_celsius, validation_func=self.__validate_sensor_min, format_dict={ 'key': self.KEY_SENSOR_MIN })
-        self.add_summary_config(items, self.SUBKEY_CHILD + self.MAXIMUM, 'sensor_max', format_func=utils.format_celsius, validation_func=self.validate_temp, format_dict={ 'key': self.KEY_SENSOR_MAX })
+        self.add_summary_config(items, self.CHILD_MINIMUM, 'sensor_min', format_func=utils.format_celsius, validation_func=self.__validate_sensor_min, summary_format=SummaryFormat(key=self.KEY_SENSOR_MIN))
+        self.add_summary_config(items, self.CHILD_MAXIMUM, 'sensor_max', format_func=utils.format_celsius, validation_func=self.validate_temp, summary_format=SummaryFormat(key=self.KEY_SENSOR_MAX))
         self.add_summary_config(items, self.PWM_INPUT, 'pwm_input', validation_func=self.validate_hwmon_object)
         return super().summary(items, sep, prefix)
 
@@ -147,9 +146,9 @@ class SectionContext(InteractiveContext):
     def __add_status(self, summary):
         enabled = self.fan_config.settings.is_enabled(self.section)
         if enabled:
-            summary.append([self.SUBKEY_CHILD + self.STATUS, self.ENABLED])
+            summary.append([self.CHILD_STATUS, self.ENABLED])
         else:
-            summary.append([self.SUBKEY_CHILD + self.STATUS, self.DISABLED, {'styling': Logger.WARNING}])
+            summary.append([self.CHILD_STATUS, self.DISABLED, SummaryFormat(styling=Logger.WARNING)])
 
 
     def __set_value(self, name, key, validation_func):
@@ -190,8 +189,9 @@ class SectionContext(InteractiveContext):
 
 
     def __handle_enable(self):
-        self.fan_config.settings.set_enabled(self.section, not self.fan_config.settings.is_enabled(self.section))
-        self.fan_config.settings.save()
+        settings = self.fan_config.settings
+        settings.set_enabled(self.section, not settings.is_enabled(self.section))
+        settings.save()
         self.message(self.CONFIG_UPDATED, end='\n\n')
         return self
 
@@ -244,8 +244,9 @@ class SectionContext(InteractiveContext):
         subsequently prompting you to choose one of the resources provided by
         it.
         '''
-        current_value = self.fan_config.settings.get(self.section, write_attribute)
-        current_object = HwmonProvider.resolve_object(current_value, self.fan_config.settings.dev_base)
+        settings = self.fan_config.settings
+        current_value = settings.get(self.section, write_attribute)
+        current_object = HwmonProvider.resolve_object(current_value, settings.dev_base)
 
         self.message()
         hwmon_info = self.__select_hwmon(current_object, filter_func=validation_func)
@@ -262,8 +263,8 @@ class SectionContext(InteractiveContext):
         if not hwmon_entry:
             return self
 
-        self.fan_config.settings.set(self.section, write_attribute, hwmon_entry.get_input(dev_base=self.fan_config.settings.dev_base))
-        self.fan_config.settings.save()
+        settings.set(self.section, write_attribute, hwmon_entry.get_input(dev_base=settings.dev_base))
+        settings.save()
         self.message(self.CONFIG_UPDATED, end='\n\n')
 
         return self
@@ -1,7 +1,7 @@
 import os
 from abc import ABC, abstractmethod
 from ..logger import LoggerMixin
-from ..exceptions import SensorException, ConfigurationError
+from ..exceptions import ConfigurationError
 from .pwm_sensor import PWMSensor
 from .fan import Fan
 
@@ -76,10 +76,11 @@ class Fan(LoggerMixin):
         elif temperature >= self.sensor_max:
             pwm_value = self.pwm_max
         else:
-            pwm_value = round((temperature - self.sensor_min) * 
-                              (self.pwm_max - self.pwm_min) /
-                              (self.sensor_max - self.sensor_min) +
-                              self.pwm_min)
+            # Integer version of mapping one range onto the other, rounding
+            # to the nearest value by adding half the divisor before dividing.
+            span = self.sensor_max - self.sensor_min
+            offset = (temperature - self.sensor_min) * (self.pwm_max - self.pwm_min)
+            pwm_value = (2 * offset + span) // (2 * span) + self.pwm_min
 
         # Check if the fan appears to have stopped. Ideally the above
         # calculation should keep the PWM-value above the level at which
@@ -1,10 +1,8 @@
-import os.path
-from ..logger import LoggerMixin
 from ..exceptions import *
 from ..scheduler import MicroScheduler
 from .sensor import Sensor
 from .pwm_request import PWMRequest
-from ..utils import format_pwm, format_rpm, format_celsius
+from ..utils import format_pwm
 
 
 class PWMSensor(Sensor):
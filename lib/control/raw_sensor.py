@@ -1,6 +1,6 @@
 import os.path
 from ..logger import LoggerMixin
-from ..exceptions import SensorException, ConfigurationError
+from ..exceptions import ConfigurationError
 
 
 class RawSensor(LoggerMixin):
@@ -1,6 +1,5 @@
-import os.path
 from ..logger import LoggerMixin
-from ..exceptions import SensorException, ConfigurationError
+from ..exceptions import SensorException
 from .raw_sensor import RawSensor
 
 
@@ -19,16 +19,37 @@ class HwmonInfo(HwmonProvider):
 
     def load_entries(self):
         self.clear_entries()
-        for dirpath, dirnames, filenames in os.walk(self.base_path):
-            filenames.sort()
-            for file in filenames:
-                HwmonFile.try_importing(self, file, self.base_path)
-            break
+        with os.scandir(self.base_path) as iterator:
+            filenames = sorted(entry.name for entry in iterator if not entry.is_dir())
+        self.files = set(filenames)
+        for file in filenames:
+            HwmonFile.try_importing(self, file, self.base_path)
+
+
+    def clear_entries(self):
+        super().clear_entries()
+        self.files = set()
+        self.driver_name = None
+
+
+    def has_file(self, file_name):
+        '''
+        Check whether a file was listed when entries were last loaded, this
+        lets entries check for related files without having to stat each of
+        them separately.
+        '''
+        return file_name in self.files
 
 
     def get_driver_name(self):
-        file_path = os.path.join(self.base_path, 'name')
-        return self.read_from(file_path, strip_contents=True)
+        '''
+        Driver name is read from sysfs the first time it is needed, then kept
+        until entries are reloaded.
+        '''
+        if self.driver_name is None:
+            file_path = os.path.join(self.base_path, 'name')
+            self.driver_name = self.read_from(file_path, strip_contents=True)
+        return self.driver_name
 
 
     def get_driver_path(self, prefix='/sys/'):
@@ -93,12 +114,15 @@ class HwmonInfo(HwmonProvider):
         list of HwmonInfo instances. An optional validation method can be
         supplied in order to make decisions on which entries to include.
         '''
+        # Entries in sysfs are symlinks to the actual device directories, so
+        # these need to be followed when checking for directories.
+        with os.scandir(cls.BASE_PATH) as iterator:
+            entries = sorted((entry for entry in iterator if entry.is_dir()), key=lambda entry: entry.name)
+
         instances = []
-        for dirpath, dirnames, filenames in os.walk(cls.BASE_PATH):
-            dirnames.sort()
-            for dir in dirnames:
-                hwmon_entry = cls(dir, os.path.join(cls.BASE_PATH, dir))
-                instances.append(hwmon_entry)
+        for entry in entries:
+            hwmon_entry = cls(entry.name, entry.path)
+            instances.append(hwmon_entry)
         return instances
     
 
@@ -202,8 +226,7 @@ class HwmonFile(HwmonObject):
 
 
     def has_suffix_key(self, suffix=''):
-        file_path = self.get_entry_path(suffix)
-        return os.path.isfile(file_path)
+        return self.hwmon_provider.has_file(self.name + suffix)
 
 
     def is_valid(self):
@@ -1,7 +1,6 @@
 import os, subprocess, time
-from pprint import pprint
 from ..exceptions import SensorException
-from ..utils import format_pwm, format_rpm, format_celsius
+from ..utils import format_rpm, format_celsius
 from .hwmon_provider import HwmonProvider
 from .hwmon_object import HwmonObject
 
@@ -1,9 +1,9 @@
 from abc import ABC, abstractmethod
-from ..exceptions import SensorException
 
 
 class HwmonObject(ABC):
     PREFIX = None
+    symbol_name = None
 
 
     def __init__(self, hwmon_provider, name):
@@ -33,8 +33,11 @@ class HwmonObject(ABC):
         '''
         Should return a string that uniquely identifies this object, used
         internally and will in no way be consistent outside of this software.
+        As neither the provider or name changes it is only built once.
         '''
-        return '{}::{}'.format(str(self.hwmon_provider), self.name)
+        if self.symbol_name is None:
+            self.symbol_name = '{}::{}'.format(str(self.hwmon_provider), self.name)
+        return self.symbol_name
 
 
     def get_provider(self):
@@ -1,4 +1,3 @@
-import os
 from abc import ABC, abstractmethod
 from ..logger import Logger
 from .hwmon_object import HwmonObject
@@ -4,5 +4,5 @@ from .queue_logger import QueueLogger
 from .journal_logger import JournalLogger
 from .formatted_logger import FormattedLogger
 from .console_logger import ConsoleLogger
-from .interactive_logger import InteractiveLogger, PromptBuilder, ConfirmPromptBuilder, PromptValidationException, ANSIContext
+from .interactive_logger import InteractiveLogger, PromptBuilder, ConfirmPromptBuilder, PromptValidationException, ANSIContext, BufferedContext
 from .logfile_logger import LogfileLogger
@@ -1,4 +1,4 @@
-import sys, tty, termios, fcntl, struct, string, math
+import sys, termios, fcntl, struct, string, math
 from . import Logger, ConsoleLogger
 from .. import utils
 
@@ -285,6 +285,8 @@ class InteractiveLogger(ConsoleLogger):
 
     def __init__(self, log_name, filter_level=Logger.INFO, auto_flush=False, formatter=None):
         super().__init__(log_name, filter_level, auto_flush, formatter)
+        self.buffer = None
+        self.buffer_depth = 0
 
 
     def log_direct(self, message, styling=DIRECT_REGULAR, end='\n', flow_text=False):
@@ -292,7 +294,38 @@ class InteractiveLogger(ConsoleLogger):
             message = self.format_flowing(message)
         if self.formatter and not self.formatter.is_monochrome:
             message = self.format_ansi(message, styling)
-        print(message, flush=self.auto_flush, end=end)
+        self.write(str(message) + end)
+
+
+    def write(self, text):
+        '''
+        Write text as-is to the console, or add it to the buffer if we're
+        currently buffering output (see BufferedContext).
+        '''
+        if self.buffer is not None:
+            self.buffer.append(text)
+            return
+        print(text, flush=self.auto_flush, end='')
+
+
+    def start_buffering(self):
+        '''
+        Start collecting output instead of writing it directly, this can be
+        nested - output is only written when the outermost call to
+        end_buffering is made.
+        '''
+        if self.buffer is None:
+            self.buffer = []
+        self.buffer_depth += 1
+
+
+    def end_buffering(self):
+        self.buffer_depth -= 1
+        if self.buffer_depth > 0:
+            return
+        output = ''.join(self.buffer)
+        self.buffer = None
+        self.write(output)
 
 
     def log_error(self, message, end='\n', flow_text=False):
@@ -481,11 +514,28 @@ class InteractiveLogger(ConsoleLogger):
 
     
     def move_cursor_up(self, count=1, clear_line=True):
-        for i in range(count):
-            # Move cursor up 
-            sys.stdout.write("\033[F")
-            if clear_line:
-                sys.stdout.write("\033[K")
+        # Move cursor up, optionally clearing each line on the way
+        sequence = "\033[F\033[K" if clear_line else "\033[F"
+        self.write(sequence * count)
+
+
+class BufferedContext:
+    '''
+    Collects everything written to the console while active, then writes it
+    all at once when leaving the context. Used when printing many short lines
+    in a row, such as summaries and listings.
+    '''
+    def __init__(self, interactive_logger):
+        self.interactive_logger = interactive_logger
+
+
+    def __enter__(self):
+        self.interactive_logger.start_buffering()
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.interactive_logger.end_buffering()
 
 
 class ANSIContext:
@@ -75,6 +75,20 @@ class MicroScheduler(LoggerMixin):
             self.log_warning('We went far into the future!')
             return True
         return now > self.trigger_at
+
+
+    def time_remaining(self, now=None):
+        '''
+        Get the number of seconds left until the next point in time, or 0 if
+        we've already passed it. Used to sleep until something needs to be
+        done rather than checking at fixed intervals.
+        '''
+        if not self.next_set:
+            raise NotScheduledException('set_next() has not been called')
+
+        if now is None:
+            now = time()
+        return max(0, self.trigger_at - now)
     
 
     @staticmethod
@@ -112,7 +112,7 @@ class Settings(LoggerMixin):
 
 
     def have_section(self, section):
-        return section in self.config.sections()
+        return self.config.has_section(section)
     
 
     def create_section(self, section):
@@ -179,7 +179,7 @@ class Settings(LoggerMixin):
 
 
     def __restore_key(self, section, key, default):
-        if section not in self.config.sections():
+        if not self.config.has_section(section):
             self.config[section] = {}
             self.changed = True
 
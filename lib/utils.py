@@ -89,15 +89,15 @@ def remap_int(value, in_min, in_max, out_min, out_max):
 
 
 def format_pwm(value):
-    return '({}/255)'.format(str(value).rjust(3))
+    return f'({value!s:>3}/255)'
 
 
 def format_rpm(value):
-    return '{} RPM'.format(str(value))
+    return f'{value} RPM'
 
 
 def format_celsius(value):
-    return '{}°C'.format(str(value))
+    return f'{value}°C'
 
 
 def pad_number(value, steps = 10):
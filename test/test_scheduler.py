@@ -60,6 +60,19 @@ class TestScheduler(unittest.TestCase):
         self.assertTrue(self.logger.includes_logged(None, Logger.WARNING))
 
 
+    def test_time_remaining(self):
+        now = time()
+
+        self.scheduler.set_next(now)
+
+        self.assertAlmostEqual(self.scheduler.time_remaining(now + 5), self.step_delay - 5)
+        self.assertEqual(self.scheduler.time_remaining(now + self.step_delay + 1), 0)
+
+
+    def test_time_remaining_not_scheduled(self):
+        self.assertRaises(NotScheduledException, self.scheduler.time_remaining)
+
+
     def test_suggest_delay(self, num_steps=10):
         value = self.scheduler.suggest_step_delay(
             self.step_delay, 